@@ -3,6 +3,39 @@ import typer
 import csv
 from centralcli import config
 
+# bulk-edit header keys that apply device wide vs per vlan
+COMMON_KEYS = [
+    "group",
+    "model",
+    "hostname",
+    "bg_peer_ip",
+    "controller_vlan",
+    "zs_site_to_site_map_name",
+    "source_fqdn",
+]
+
+
+def classify_column(key: str) -> str:
+    """Tag a normalized bulk-edit header key with how its cells are handled."""
+    if key == "mac_address":
+        return "mac"
+    elif key in COMMON_KEYS:
+        return "common"
+    elif key == "vlan_id":
+        return "vlan_id"
+    elif key.startswith("dns_server_"):
+        return "dns_server"
+    elif key.startswith("dhcp_default_router"):
+        return "dhcp_def_gw"
+    elif key.startswith("dhcp_exclude_start"):
+        return "excl_start"
+    elif key.startswith("dhcp_exclude_end"):
+        return "excl_end"
+    elif key.startswith(("vlan", "dhcp", "domain", "dns", "vrrp", "access_port", "ppoe")):
+        return "vlan"
+    else:
+        return "skip"
+
 
 def eval_caas_response(resp) -> None:
     if not resp.ok:
@@ -47,6 +80,8 @@ def eval_caas_response(resp) -> None:
 
 class BuildCLI:
     """Build equivelent cli commands for caas API from bulk-edit.csv import file"""
+    __slots__ = ("central", "dev_info", "data", "cmds")
+
     def __init__(self, central=None, data: dict = None, ) -> None:
         self.central = central
 
@@ -63,105 +98,117 @@ class BuildCLI:
         _mac = "error"
         _exclude_start = ''
         with filename.open() as csv_file:
-            csv_reader = csv.reader([line for line in csv_file.readlines() if not line.startswith('#')])
-
-            csv_rows = [r for r in csv_reader]
+            # stream the file through the csv reader vs materializing it as 2 lists
+            csv_reader = csv.reader(line for line in csv_file if not line.startswith('#'))
+            headers = [k.strip().lower().replace(' ', '_') for k in next(csv_reader, [])]
+            # classify each column once, the row loop below just dispatches on the tag
+            cols = [(k, classify_column(k)) for k in headers]
 
-            for data_row in csv_rows[1:]:
+            for data_row in csv_reader:
                 vlan_data = {}
-                for k, v in zip(csv_rows[0], data_row):
-                    k = k.strip().lower().replace(' ', '_')
+                for (k, tag), v in zip(cols, data_row):
                     # print(f"{k}: {v}")
-                    if k == "mac_address":
+                    if tag == "mac":
                         _mac = v
                         cli_data[v] = {}
-                    elif k in [
-                        "group",
-                        "model",
-                        "hostname",
-                        "bg_peer_ip",
-                        "controller_vlan",
-                        "zs_site_to_site_map_name",
-                        "source_fqdn"
-                    ]:
+                    elif tag == "common":
                         _common[k] = v
-                    elif k.startswith(("vlan", "dhcp", "domain", "dns", "vrrp", "access_port", "ppoe")):
-                        if k == "vlan_id":
-                            if vlan_data:
-                                _vlans.append(vlan_data)
-                            vlan_data = {k: v}
-                        elif k.startswith("dns_server_"):
-                            vlan_data["dns_servers"] = [v] if "dns_servers" not in vlan_data else \
-                                                              [*vlan_data["dns_servers"], *[v]]
-                        elif k.startswith("dhcp_default_router"):
-                            vlan_data["dhcp_def_gws"] = [v] if "dhcp_def_gws" not in vlan_data else \
-                                                               [*vlan_data["dhcp_def_gws"], *[v]]
-                        elif k.startswith("dhcp_exclude_start"):
-                            _exclude_start = v
-                        elif k.startswith("dhcp_exclude_end"):
-                            if _exclude_start:
-                                _line = f"ip dhcp exclude-address {_exclude_start} {v}"
-                                vlan_data["dhcp_excludes"] = [_line] if "dhcp_excludes" not in vlan_data else \
-                                                                        [*vlan_data["dhcp_excludes"], *[_line]]
-                                _exclude_start, _line = '', ''
-                            else:
-                                print(f"Validation Error DHCP Exclude End with no preceding start ({v})... Ignoring")
+                    elif tag == "vlan_id":
+                        if vlan_data:
+                            _vlans.append(vlan_data)
+                        vlan_data = {k: v}
+                    elif tag == "dns_server":
+                        vlan_data.setdefault("dns_servers", []).append(v)
+                    elif tag == "dhcp_def_gw":
+                        vlan_data.setdefault("dhcp_def_gws", []).append(v)
+                    elif tag == "excl_start":
+                        _exclude_start = v
+                    elif tag == "excl_end":
+                        if _exclude_start:
+                            vlan_data.setdefault("dhcp_excludes", []).append(
+                                f"ip dhcp exclude-address {_exclude_start} {v}"
+                            )
+                            _exclude_start = ''
                         else:
-                            vlan_data[k] = v
+                            print(f"Validation Error DHCP Exclude End with no preceding start ({v})... Ignoring")
+                    elif tag == "vlan":
+                        vlan_data[k] = v
 
                 _vlans.append(vlan_data)
                 cli_data[_mac] = {"_common": _common, "vlans": _vlans}
 
         return cli_data
 
+    def _verify_group_move(self, dev: str, gw_by_mac: dict) -> tuple:
+        """Check a bulk-edit device against gateway inventory.
+
+        Returns (common, serial) if the device exists but is in the wrong
+        group (i.e. needs a move), else None.
+        """
+        common = self.data[dev]["_common"]
+        self.dev_info = gw_by_mac.get(dev.lower())
+
+        # if dev already exists move to group defined in bulk-edit
+        if self.dev_info and common["group"] != self.dev_info["group"]:
+            _pretty_name = typer.style(common.get('hostname', dev), fg="bright_green")
+            typer.echo(f"Moving {_pretty_name} to Group {common['group']}")
+            return common, self.dev_info["serial"]
+
     def build_cmds(self, data: dict = None, file: Path = config.bulk_edit_file) -> list:
         if data:
             self.data = data
         else:
             self.data = self.get_bulkedit_data(file)
 
+        # gateway inventory is invariant for the run, fetch once vs once per device
+        resp = self.central.request(self.central.get_devices, "gateways")
+        if not resp.ok:
+            typer.secho(f"Error Returned Fetching gateway inventory [{resp.status_code}] {resp.error}", fg="red")
+            raise typer.Exit(1)
+        gw_by_mac = {_dev["mac"].lower(): _dev for _dev in resp.output if _dev.get("mac")}
+
+        moves = [m for m in (self._verify_group_move(dev, gw_by_mac) for dev in self.data) if m]
+
+        # each move is an independent API call, fan them out in parallel
+        if moves:
+            reqs = [
+                self.central.BatchRequest(self.central.move_devices_to_group, (common["group"], serial))
+                for common, serial in moves
+            ]
+            for (common, _), res in zip(moves, self.central.batch_request(reqs)):
+                if not res:
+                    typer.secho(
+                        f"Error Returned Moving {common['hostname']} to Group {common['group']}", fg="red"
+                    )
+                    raise typer.Exit(1)
+
         for dev in self.data:
             common = self.data[dev]["_common"]
             vlans = self.data[dev]["vlans"]
             _pretty_name = typer.style(common.get('hostname', dev), fg="bright_green")
-            # print(f"Verifying {_pretty_name} is in Group {common['group']}...", end='')
-            # group_devs = self.session.get_gateways_by_group(self.data[dev]["_common"]["group"])
-            resp = self.central.request(self.central.get_devices, "gateways")
-            gateways = resp.output
-            self.dev_info = [_dev for _dev in gateways if _dev.get('mac', '').lower() == dev.lower()]
-
-            # if dev already exists move to group defined in bulk-edit
-            if self.dev_info:
-                self.dev_info = self.dev_info[0]
-                if common["group"] != self.dev_info["group"]:
-                    # print(" it is *Not*", end="\n")
-                    typer.echo(f"Moving {_pretty_name} to Group {common['group']}")
-                    res = self.central.move_dev_to_group(common["group"], self.dev_info["serial"])
-                    if not res:
-                        typer.secho(
-                            f"Error Returned Moving {common['hostname']} to Group {common['group']}", fg="red"
-                        )
-                        raise typer.Exit(1)
-
             typer.echo(f"Building cmds for {_pretty_name}")
+            # collect into a local list with bound methods, extend self.cmds once per device
+            out = []
+            append = out.append
+            extend = out.extend
             if common.get("hostname"):
-                self.cmds += [f"hostname {common['hostname']}", "!"]
+                extend((f"hostname {common['hostname']}", "!"))
 
             for v in vlans:
-                self.cmds += [f"vlan {v['vlan_id']}", "!"]
+                extend((f"vlan {v['vlan_id']}", "!"))
                 if v.get("vlan_ip"):
                     if not v.get("vlan_subnet"):
                         print(f"Validation Error No subnet mask for VLAN {v['vlan_id']} ")
                         # TODO handle the error
-                    self.cmds += [f"interface vlan {v['vlan_id']}", f"ip address {v['vlan_ip']} {v['vlan_subnet']}"]
+                    extend((f"interface vlan {v['vlan_id']}", f"ip address {v['vlan_ip']} {v['vlan_subnet']}"))
                     # TODO should VLAN description also be vlan name - check what bulk edit does
                     if v.get("vlan_interface_description"):
-                        self.cmds.append(f"description {v['vlan_interface_description']}")
+                        append(f"description {v['vlan_interface_description']}")
                     if v.get("vlan_helper_addr"):
-                        self.cmds.append(f"ip helper-address {v['vlan_helper_addr']}")
+                        append(f"ip helper-address {v['vlan_helper_addr']}")
                     if v.get("vlan_interface_operstate"):
-                        self.cmds.append(f"operstate {v['vlan_interface_operstate']}")
-                    self.cmds.append("!")
+                        append(f"operstate {v['vlan_interface_operstate']}")
+                    append("!")
 
                 if v.get("pppoe_username"):
                     print("Warning PPPoE not supported by this tool yet")
@@ -171,50 +218,53 @@ class BuildCLI:
                         _line = f"interface gigabitethernet {v['access_port']}"
                     else:
                         _line = f"interface {v['access_port']}"
-                    self.cmds += [_line, f"switchport access vlan {v['vlan_id']}", "!"]
+                    extend((_line, f"switchport access vlan {v['vlan_id']}", "!"))
 
                 if v.get("dhcp_pool_name"):
-                    self.cmds.append(f"ip dhcp pool {v['dhcp_pool_name']}")
+                    append(f"ip dhcp pool {v['dhcp_pool_name']}")
                     if v.get("dhcp_def_gws"):
                         for gw in v["dhcp_def_gws"]:
-                            self.cmds.append(f"default-router {gw}")
+                            append(f"default-router {gw}")
                     if v.get("dns_servers"):
-                        self.cmds.append(f"dns-server {' '.join(v['dns_servers'])}")
+                        append(f"dns-server {' '.join(v['dns_servers'])}")
                     if v.get("domain_name"):
-                        self.cmds.append(f"domain-name {v['domain_name']}")
+                        append(f"domain-name {v['domain_name']}")
                     if v.get("dhcp_network"):
                         if v.get("dhcp_mask"):
-                            self.cmds.append(f"network {v['dhcp_network']} {v['dhcp_mask']}")
+                            append(f"network {v['dhcp_network']} {v['dhcp_mask']}")
                         elif v.get("dhcp_network_prefix"):
-                            self.cmds.append(f"network {v['dhcp_network']} /{v['dhcp_network_prefix']}")
-                    self.cmds.append("!")
+                            append(f"network {v['dhcp_network']} /{v['dhcp_network_prefix']}")
+                    append("!")
 
                 if v.get("dhcp_excludes"):
                     # dhcp exclude lines are fully formatted as data is collected
-                    for _line in v["dhcp_excludes"]:
-                        self.cmds.append(_line)
+                    extend(v["dhcp_excludes"])
 
                 if v.get("vrrp_id"):
                     if v.get("vrrp_ip"):
-                        self.cmds += [f"vrrp {v['vrrp_id']}", f"ip address {v['vrrp_ip']}", f"vlan {v['vlan_id']}"]
+                        extend((f"vrrp {v['vrrp_id']}", f"ip address {v['vrrp_ip']}", f"vlan {v['vlan_id']}"))
                         if v.get("vrrp_priority"):
-                            self.cmds.append(f"priority {v['vrrp_priority']}")
-                        self.cmds += ["no shutdown", "!"]
+                            append(f"priority {v['vrrp_priority']}")
+                        extend(("no shutdown", "!"))
                     else:
                         print(f"Validation Error VRRP ID {v['vrrp_id']} VLAN {v['vlan_id']} No VRRP IP provided... Skipped")
 
                 if v.get("bg_peer_ip"):
                     # _as = self.session.get_bgp_as()
-                    # self.cmds.append(f"router bgp neighbor {v['bg_peer_ip']} as {_as}")
+                    # append(f"router bgp neighbor {v['bg_peer_ip']} as {_as}")
                     print("bgp peer ip Not Supported by Script yet")
 
                 if v.get("zs_site_to_site_map_name") or v.get("source_fqdn"):
                     print("Zscaler Configuration Not Supported by Script Yet")
 
-            return self.cmds
+            self.cmds.extend(out)
+
+        return self.cmds
 
 
 class CaasAPI(BuildCLI):
+    __slots__ = ("file",)
+
     def __init__(self, central=None, data: dict = None, file: Path = None) -> None:
         self.data = data
         self.central = central
@@ -8,14 +8,13 @@ import time
 from asyncio.proactor_events import _ProactorBasePipeTransport
 from functools import wraps
 from pathlib import Path
-from typing import Any, Dict, List, Literal, Tuple, Union
+from typing import Any, AsyncIterator, Dict, List, Literal, Tuple, Union
 
-from aiohttp import ClientSession
 import aiohttp
 from pycentral.base_utils import tokenLocalStoreUtil
 
 from . import ArubaCentralBase, MyLogger, cleaner, config, log, utils, constants
-from .response import Response, Session
+from .response import Response, Session, new_aio_session
 
 
 # https://github.com/aio-libs/aiohttp/issues/4324
@@ -82,6 +81,12 @@ def multipartify(data, parent_key=None, formatter: callable = None) -> dict:
     return dict(converted)
 
 
+def token_is_expired(token: dict) -> bool:
+    """True if token carries an expires_at stamp that has lapsed (60s grace)."""
+    expires_at = token.get("expires_at")
+    return expires_at is not None and time.time() > expires_at - 60
+
+
 def get_conn_from_file(account_name, logger: MyLogger = log):
     """Creates an instance of class`pycentral.ArubaCentralBase` based on config file.
 
@@ -129,10 +134,19 @@ def get_conn_from_file(account_name, logger: MyLogger = log):
         if not conn.storeToken(conn.central_info.get("token")):
             log.warning("Failed to Store Token and token cache doesn't exist yet.", show=True)
 
+    # Prefer a token we know hasn't expired yet.  Leading with a known expired token
+    # guarantees an invalid_token response and a refresh/retry round-trip.
+    token = conn.central_info.get("token")
+    retry_token = conn.central_info.get("retry_token")
+    if token and retry_token and token_is_expired(token) and not token_is_expired(retry_token):
+        conn.central_info["token"], conn.central_info["retry_token"] = retry_token, token
+
     return conn
 
 
 class BatchRequest:
+    __slots__ = ("func", "args", "kwargs")
+
     def __init__(self, func: callable, args: Any = (), **kwargs: dict) -> None:
         """Contructor object for for api requests.
 
@@ -150,9 +164,12 @@ class BatchRequest:
 
 
 class CentralApi(Session):
+    __slots__ = ("BatchRequest", "_group_cache")
+
     def __init__(self, account_name: str = "central_info"):
         self.silent = False  # toggled in _batch_request to squelch Auto logging in Response
         self.BatchRequest = BatchRequest
+        self._group_cache = {}  # serial -> group Response, populated by get_group_for_dev_by_serial
         self.auth = get_conn_from_file(account_name)
         super().__init__(auth=self.auth)
 
@@ -172,7 +189,7 @@ class CentralApi(Session):
         return form
 
     async def _request(self, func, *args, **kwargs):
-        async with ClientSession() as self.aio_session:
+        async with new_aio_session() as self.aio_session:
             return await func(*args, **kwargs)
 
     def request(self, func: callable, *args, **kwargs) -> Response:
@@ -187,7 +204,7 @@ class CentralApi(Session):
         return asyncio.run(self._request(func, *args, **kwargs))
 
     async def _batch_request(self, api_calls: List[BatchRequest],) -> List[Response]:
-        async with ClientSession() as self.aio_session:
+        async with new_aio_session() as self.aio_session:
             # Always run first call solo to ensure access token validity
             self.silent = True
             resp = await api_calls[0].func(
@@ -219,17 +236,13 @@ class CentralApi(Session):
         return asyncio.run(self._batch_request(api_calls))
 
     async def get(self, url, params: dict = {}, headers: dict = None, **kwargs) -> Response:
-        f_url = self.auth.central_info["base_url"] + url
-        params = self.strip_none(params)
+        f_url = self.base_url + url
         return await self.api_call(f_url, params=params, headers=headers, **kwargs)
 
     async def post(
         self, url, params: dict = {}, payload: dict = None, json_data: Union[dict, list] = None, headers: dict = None, **kwargs
     ) -> Response:
-        f_url = self.auth.central_info["base_url"] + url
-        params = self.strip_none(params)
-        if json_data:
-            json_data = self.strip_none(json_data)
+        f_url = self.base_url + url
         return await self.api_call(
             f_url, method="POST", data=payload, json_data=json_data, params=params, headers=headers, **kwargs
         )
@@ -238,16 +251,14 @@ class CentralApi(Session):
         self, url, params: dict = {}, payload: dict = None, json_data: Union[dict, list] = None, headers: dict = None, **kwargs
     ) -> Response:
 
-        f_url = self.auth.central_info["base_url"] + url
-        params = self.strip_none(params)
+        f_url = self.base_url + url
         return await self.api_call(
             f_url, method="PUT", data=payload, json_data=json_data, params=params, headers=headers, **kwargs
         )
 
     async def patch(self, url, params: dict = {}, payload: dict = None,
                     json_data: Union[dict, list] = None, headers: dict = None, **kwargs) -> Response:
-        f_url = self.auth.central_info["base_url"] + url
-        params = self.strip_none(params)
+        f_url = self.base_url + url
         return await self.api_call(f_url, method="PATCH", data=payload,
                                    json_data=json_data, params=params, headers=headers, **kwargs)
 
@@ -260,8 +271,7 @@ class CentralApi(Session):
         headers: dict = None,
         **kwargs
     ) -> Response:
-        f_url = self.auth.central_info["base_url"] + url
-        params = self.strip_none(params)
+        f_url = self.base_url + url
         return await self.api_call(f_url, method="DELETE", data=payload,
                                    json_data=json_data, params=params, headers=headers, **kwargs)
 
@@ -271,7 +281,7 @@ class CentralApi(Session):
         if not isinstance(_dict, dict):
             return _dict
 
-        return _dict if _dict is None else {k: v for k, v in _dict.items() if v is not None}
+        return {k: v for k, v in _dict.items() if v is not None}
 
     # doesn't appear to work. referenced in swagger to get listing of types (New Device Inventory: Get Devices...)
     async def get_dev_types(self):
@@ -841,6 +851,72 @@ class CentralApi(Session):
             params = {"limit": 20, "offset": 0}
         return await self.get(url, params=params)
 
+    async def _iter_pages(self, url: str, params: dict = {}, page_size: int = 20) -> AsyncIterator[Response]:
+        """Yield Responses for a paged API method one page at a time.
+
+        The next page is requested as soon as the current one arrives, so the
+        caller's processing of each page overlaps the in-flight fetch.
+
+        Args:
+            url (str): API endpoint (passed to self.get).
+            params (dict, optional): Additional query params beyond limit/offset.
+            page_size (int, optional): Number of records per yielded page. Defaults to 20.
+
+        Yields:
+            Response: CentralAPI Response object for each page.
+        """
+        offset = 0
+        in_flight = asyncio.ensure_future(
+            self.get(url, params={**params, "limit": page_size, "offset": offset}, count=page_size)
+        )
+        while True:
+            resp = await in_flight
+            if not resp.ok or not resp.output:
+                if not resp.ok:
+                    yield resp
+                break
+
+            # prefetch the next page while the caller processes this one
+            offset += page_size
+            in_flight = asyncio.ensure_future(
+                self.get(url, params={**params, "limit": page_size, "offset": offset}, count=page_size)
+            )
+            yield resp
+
+            if len(resp.output) < page_size:
+                in_flight.cancel()
+                break
+
+    async def iter_variables(self, page_size: int = 20) -> AsyncIterator[Response]:
+        """Iterate template variables for all devices, one page per iteration.
+
+        Pages beyond the first are prefetched while the caller processes the
+        current page, vs get_variables which aggregates all pages serially.
+
+        Args:
+            page_size (int, optional): Number of devices per page. Defaults to 20.
+
+        Yields:
+            Response: CentralAPI Response object for each page of devices.
+        """
+        url = "/configuration/v1/devices/template_variables"
+        async for resp in self._iter_pages(url, page_size=page_size):
+            yield resp
+
+    async def iter_certificates(self, q: str = None, page_size: int = 20) -> AsyncIterator[Response]:
+        """Iterate certificates, one page per iteration with prefetch.
+
+        Args:
+            q (str, optional): Search for a particular certificate by its name, md5 hash or sha1_hash
+            page_size (int, optional): Number of certificates per page. Defaults to 20, Max 20.
+
+        Yields:
+            Response: CentralAPI Response object for each page of certificates.
+        """
+        url = "/configuration/v1/certificates"
+        async for resp in self._iter_pages(url, params={"q": q}, page_size=page_size):
+            yield resp
+
     # async def update_variables(self, serialnum: str, **var_dict: dict) -> bool:
     #     url = f"/configuration/v1/devices/{serialnum}/template_variables"
     #     var_dict = json.dumps(var_dict)
@@ -943,7 +1019,7 @@ class CentralApi(Session):
         }
 
         url = f"/monitoring/v1/{dev_type}"  # (inside brackets = same response) switches, aps, [mobility_controllers, gateways]
-        if dev_type == "aps" and "internal" in self.auth.central_info["base_url"]:
+        if dev_type == "aps" and "internal" in self.base_url:
             url = url.replace("v1", "v2")
         # TODO move cleaner into cli ... make this sep library dependency
         # TODO sort not implemented yet
@@ -1053,8 +1129,28 @@ class CentralApi(Session):
         params = {"group": group}
         return await self.get(url, params=params)
 
+    async def get_gateways_by_groups(self, groups: List[str]) -> Dict[str, Response]:
+        """Get gateways for multiple groups concurrently.
+
+        Args:
+            groups (List[str]): List of group names to fetch gateways for.
+
+        Returns:
+            Dict[str, Response]: Mapping of group name to CentralAPI Response object
+        """
+        responses = await asyncio.gather(*(self.get_gateways_by_group(group) for group in groups))
+        return dict(zip(groups, responses))
+
     async def get_group_for_dev_by_serial(self, serial_num):
-        return await self.get(f"/configuration/v1/devices/{serial_num}/group")
+        # group membership rarely changes mid-run, cache per serial
+        # (entries are dropped by move_devices_to_group)
+        if serial_num not in self._group_cache:
+            resp = await self.get(f"/configuration/v1/devices/{serial_num}/group")
+            if not resp.ok:
+                return resp
+            self._group_cache[serial_num] = resp
+
+        return self._group_cache[serial_num]
 
     async def get_dhcp_client_info_by_gw(self, serial_num):
         url = f"/monitoring/v1/mobility_controllers/{serial_num}/dhcp_clients"
@@ -2322,6 +2418,10 @@ class CentralApi(Session):
             if match_str in resp.output.get("description", ""):
                 resp.ok = True
 
+        if resp.ok:
+            for serial in serial_nums:
+                self._group_cache.pop(serial, None)
+
         return resp
 
     async def move_devices_to_site(
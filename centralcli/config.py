@@ -139,7 +139,8 @@ class Config:
                     if import_file.suffix == ".json":
                         return json.loads(f.read())
                     elif import_file.suffix in [".yaml", ".yml"]:
-                        return yaml.load(f, Loader=yaml.SafeLoader)
+                        # CSafeLoader (libyaml) is drastically faster, fall back to pure python SafeLoader
+                        return yaml.load(f, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
                     elif import_file.suffix in ['.csv', '.tsv', '.dbf', '.xls', '.xlsx']:
                         with import_file.open('r') as fh:
                             return tablib.Dataset().load(fh)
@@ -10,6 +10,7 @@ from typing import Union, List, Any
 from centralcli import config, utils, log
 from halo import Halo
 
+import asyncio
 import sys
 import typer
 import json
@@ -17,13 +18,33 @@ import aiohttp
 import time
 
 
+try:
+    # 3-10x faster than stdlib json, bulk device/client payloads benefit the most
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
+
+
 DEFAULT_HEADERS = {
     'Content-Type': 'application/json',
     'Accept': 'application/json'
 }
 
 
+def new_aio_session() -> aiohttp.ClientSession:
+    """Return aiohttp.ClientSession with a pooled connector.
+
+    Connections are kept-alive and re-used for all requests made during the
+    invocation vs paying TCP+TLS setup on every call.  DNS lookups for the
+    base_url are cached so concurrent/back-to-back calls resolve once.
+    """
+    connector = aiohttp.TCPConnector(limit=20, ttl_dns_cache=300, keepalive_timeout=60)
+    return aiohttp.ClientSession(connector=connector)
+
+
 class RateLimit:
+    __slots__ = ("total", "remain", "used", "ok")
+
     def __init__(self, resp: aiohttp.ClientResponse = None):
         self.total, self.remain = 0, 0
         if resp and hasattr(resp, "headers"):
@@ -235,6 +256,8 @@ def get_multiline_input(prompt: str = None, print_func: callable = print,
 
 
 class Session:
+    __slots__ = ("silent", "auth", "_aio_session", "headers", "base_url", "ssl", "req_cnt", "spinner")
+
     def __init__(
         self,
         auth: ArubaCentralBase = None,
@@ -246,6 +269,7 @@ class Session:
         self._aio_session = aio_session
         self.headers = DEFAULT_HEADERS
         self.headers["authorization"] = f"Bearer {auth.central_info['token']['access_token']}"
+        self.base_url = auth.central_info["base_url"]
         self.ssl = auth.ssl_verify
         self.req_cnt = 1
         self.spinner = Halo("Collecting Data...", enabled=bool(utils.tty))
@@ -253,7 +277,11 @@ class Session:
 
     @property
     def aio_session(self):
-        return self._aio_session if self._aio_session and not self._aio_session.closed else aiohttp.ClientSession()
+        if self._aio_session and not self._aio_session.closed:
+            return self._aio_session
+
+        self._aio_session = new_aio_session()
+        return self._aio_session
 
     @aio_session.setter
     def aio_session(self, session: aiohttp.ClientSession):
@@ -271,14 +299,18 @@ class Session:
         spin_txt_fail = f"{spin_word} Data{_data_msg}"
         self.spinner.text = spin_txt_run
         self.req_cnt += 1
-        for _ in range(0, 2):
+        # only GET retries 500: POST/PUT/DELETE are not idempotent, and at least one
+        # endpoint (configuration/v1/devices/move) returns 500 on success
+        _retry_status = (429, 500, 502, 503, 504) if method == "GET" else (429, 502, 503, 504)
+        for _ in range(0, 4):
             if _ > 0:
-                spin_txt_run = f"{spin_txt_run} (retry after token refresh)"
+                spin_txt_run = f"{spin_txt_run} (retry {_})"
 
-            log.debug(f"Attempt API Call to:{_data_msg}Try: {_ + 1}\n"
-                      f"    access token: {auth.central_info.get('token', {}).get('access_token', {})}\n"
-                      f"    refresh token: {auth.central_info.get('token', {}).get('refresh_token', {})}"
-                      )
+            if log.DEBUG:  # skip f-string evaluation on the hot path when not debugging
+                log.debug(f"Attempt API Call to:{_data_msg}Try: {_ + 1}\n"
+                          f"    access token: {auth.central_info.get('token', {}).get('access_token', {})}\n"
+                          f"    refresh token: {auth.central_info.get('token', {}).get('refresh_token', {})}"
+                          )
 
             try:
                 _start = time.time()
@@ -299,7 +331,7 @@ class Session:
                 elapsed = time.time() - _start
 
                 try:
-                    output = await resp.json()
+                    output = await resp.json(loads=json_loads)
                     try:
                         raw_output = output.copy()
                     except AttributeError:
@@ -318,6 +350,15 @@ class Session:
                 self.spinner.fail(fail_msg)
                 if "invalid_token" in resp.output:
                     self.refresh_token()
+                elif resp.status in _retry_status and _ < 3:
+                    # transient failure (rate-limit / server error), back off and retry
+                    retry_after = None if resp._response is None else resp._response.headers.get("Retry-After")
+                    try:
+                        wait = float(retry_after)
+                    except (TypeError, ValueError):  # absent or an http-date rather than seconds
+                        wait = 0.5 * 2 ** _
+                    log.warning(f"API [{method}] {url} Returned {resp.status}, retry in {wait}s")
+                    await asyncio.sleep(wait)
                 else:
                     log.error(f"API [{method}] {url} Error Returned: {resp.error}")
                     break
@@ -406,6 +447,8 @@ class Session:
                     spin.start()
                 token = auth.refreshToken(t)
                 if token:
+                    # stamp expiry so later runs can avoid leading with a known expired token
+                    token["expires_at"] = int(time.time()) + int(token.get("expires_in", 7200))
                     auth.storeToken(token)
                     auth.central_info["token"] = token
                     spin.stop()
@@ -450,7 +493,7 @@ class Session:
         auth = self.auth
         token_data: dict = None
         if sys.stdin.isatty():
-            internal = "internal" in auth.central_info["base_url"]
+            internal = "internal" in self.base_url
 
             token_only = [
                 auth.central_info.get("username") is None
@@ -2,13 +2,12 @@
 # -*- coding: utf-8 -*-
 
 import json
-import os
 import shutil
 import socket
 import string
 import sys
 import urllib.parse
-from pprint import pprint
+from pathlib import Path
 from typing import Any, Dict, List, Tuple, Union
 import typer
 import logging
@@ -49,11 +48,19 @@ class Convert:
         self.dashes = '-'.join(self.clean[i:i+2] for i in range(0, len(self), 2))
         self.dots = '.'.join(self.clean[i:i+4] for i in range(0, len(self), 4))
         self.dec = int(self.clean, 16) if self.ok else 0
-        self.url = urllib.parse.quote_plus(mac)
+        self._url_src = mac
+        self._url = None
 
     def __len__(self):
         return len(self.clean)
 
+    @property
+    def url(self):
+        """percent-encoded form, quoted lazily on first access"""
+        if self._url is None:
+            self._url = urllib.parse.quote_plus(self._url_src)
+        return self._url
+
 
 class Mac(Convert):
     def __init__(self, mac, fuzzy: bool = False):
@@ -104,7 +111,8 @@ class Utils:
         try:
             ret = json.dumps(obj, indent=4, sort_keys=True)
         except Exception:
-            ret = pprint(obj, indent=4, sort_dicts=True)
+            from pprint import pformat  # fallback only, keep pprint off the import path
+            ret = pformat(obj, indent=4)
         finally:
             print(ret)
 
@@ -156,7 +164,8 @@ class Utils:
         return _reachable
 
     def valid_file(self, filepath):
-        return os.path.isfile(filepath) and os.stat(filepath).st_size > 0
+        filepath = Path(filepath)
+        return filepath.is_file() and filepath.stat().st_size > 0
 
     def listify(self, var):
         if isinstance(var, tuple):
@@ -279,7 +288,7 @@ class Utils:
         if not isinstance(_dict, dict):
             return _dict
 
-        return _dict if _dict is None else {k: v for k, v in _dict.items() if v is not None}
+        return {k: v for k, v in _dict.items() if v is not None}
 
     class Output:
         def __init__(self, rawdata: str = "", prettydata: str = "", config=None):
@@ -438,7 +447,7 @@ class Utils:
             _lexer = lexers.JsonLexer
 
         elif tablefmt in ["yml", "yaml"]:
-            raw_data = yaml.dump(outdata, sort_keys=False)
+            raw_data = yaml.dump(outdata, sort_keys=False, Dumper=getattr(yaml, "CSafeDumper", yaml.SafeDumper))
             _lexer = lexers.YamlLexer
 
         elif tablefmt == "csv":